@@ -1,24 +1,36 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import json
 import logging
+import os
+import re
+import sys
+import time
 from pathlib import Path
-
-from dotenv import load_dotenv
-from openai import OpenAI
-from pydantic import BaseModel, field_validator
-from reportlab.lib.pagesizes import LETTER
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
-from rich.logging import RichHandler
-
-load_dotenv()
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[RichHandler(rich_tracebacks=True)],
+from typing import Any, Callable, Mapping, TextIO, TypedDict
+
+import httpx
+from jiter import from_json
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
 )
+try:
+    import orjson
+except ImportError:  # optional: `pip install .[fast]`
+    orjson = None
+
 logger = logging.getLogger("cover_letters")
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -27,32 +39,174 @@ INPUT_DIR = BASE_DIR / "inputs"
 SUMMARY_PATH = INPUT_DIR / "summary.txt"
 SAMPLE_LETTER_PATH = INPUT_DIR / "sample_letter.txt"
 PROMPT_PATH = INPUT_DIR / "prompt.txt"
+CACHE_DIR = BASE_OUTPUT_DIR / ".cache"
+# Stands in for {job_description} in the system prompt; the job itself is
+# sent as the user message so the system prompt stays identical across calls
+# and can be served from OpenAI's prompt cache.
+JOB_DESCRIPTION_REFERENCE = "(provided in the user message)"
+# Longer values (or ones with newlines) are pasted text, never a path.
+MAX_JOB_DESCRIPTION_PATH_LENGTH = 512
+# Anything shorter is an empty or placeholder input not worth an API call.
+MIN_JOB_DESCRIPTION_LENGTH = 40
 DEFAULT_LLM_MODEL = "gpt-4o"
 # DEFAULT_LLM_MODEL = "gpt-5.2-mini"
+# A 120-180 word letter plus its filename fits well under this; the cap stops
+# a drifting completion from running long. Packed requests scale it per letter.
+LLM_MAX_COMPLETION_TOKENS = 400
+LLM_TEMPERATURE = 0.3
+
+# HTTP client constants
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+# HTTP/2 needs the optional h2 package (`pip install .[fast]`).
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# Batch API constants
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INITIAL_DELAY = 5.0
+BATCH_POLL_MAX_DELAY = 300.0
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Concurrent request constants
+DEFAULT_CONCURRENCY = 8
+DEFAULT_JOBS_PER_REQUEST = 5
+DEFAULT_REQUESTS_PER_MINUTE = 500
+DEFAULT_TOKENS_PER_MINUTE = 30_000
+CHARS_PER_TOKEN_ESTIMATE = 4
+RETRY_MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
 
 # PDF layout constants
-PDF_PAGE_SIZE = LETTER
+PDF_PAGE_SIZE = (612.0, 792.0)  # US Letter in points, same as reportlab's LETTER
 PDF_MARGIN = 72
 PDF_FONT_NAME = "Helvetica"
 PDF_FONT_SIZE = 11
 PDF_LINE_HEIGHT = 15
-PDF_PARAGRAPH_SPACING = 10
-PDF_PARAGRAPH_SPACER = 2
+PDF_WRITE_BUFFER_SIZE = 1 << 16
+
+FILENAME_PATTERN = re.compile(r"[A-Za-z0-9_]+")
+
+
+def configure_logging() -> None:
+    # Imported here so `--help` and argument errors don't pay for rich.
+    from rich.logging import RichHandler
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[RichHandler(rich_tracebacks=True)],
+    )
+
+
+def load_environment() -> None:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def json_loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Generate a cover letter (text + PDF) from a job description using OpenAI."
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "-j",
         "--job-description",
-        required=True,
         help="Job description text or a path to a .txt file containing it.",
     )
-    return parser.parse_args()
-
-
+    source.add_argument(
+        "--jobs",
+        type=Path,
+        help=(
+            "Directory of .txt job descriptions or a .jsonl file with one job "
+            "description per line."
+        ),
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit --jobs through the OpenAI Batch API (cheaper, up to 24h turnaround).",
+    )
+    parser.add_argument(
+        "--resume-batch",
+        metavar="BATCH_ID",
+        help="Collect results from an already submitted --batch run instead of resubmitting.",
+    )
+    # The concurrent-run options default to None so an explicit value can be
+    # rejected where it would have no effect; real defaults are filled in below.
+    concurrent = parser.add_argument_group(
+        "concurrent --jobs runs", "Only valid with --jobs and without --batch."
+    )
+    concurrent.add_argument(
+        "--batch-size",
+        type=int,
+        help=f"Job descriptions packed into each request (default: {DEFAULT_JOBS_PER_REQUEST}).",
+    )
+    concurrent.add_argument(
+        "--concurrency",
+        type=int,
+        help=f"Maximum in-flight API requests (default: {DEFAULT_CONCURRENCY}).",
+    )
+    concurrent.add_argument(
+        "--rpm",
+        type=int,
+        help=f"Requests-per-minute budget (default: {DEFAULT_REQUESTS_PER_MINUTE}).",
+    )
+    concurrent.add_argument(
+        "--tpm",
+        type=int,
+        help=f"Tokens-per-minute budget (default: {DEFAULT_TOKENS_PER_MINUTE}).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor write the on-disk response cache.",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached responses but store the fresh ones.",
+    )
+    args = parser.parse_args()
+    if args.batch and args.jobs is None:
+        parser.error("--batch requires --jobs.")
+    if args.resume_batch and not args.batch:
+        parser.error("--resume-batch requires --batch.")
+
+    concurrent_options = {
+        "--batch-size": ("batch_size", DEFAULT_JOBS_PER_REQUEST),
+        "--concurrency": ("concurrency", DEFAULT_CONCURRENCY),
+        "--rpm": ("rpm", DEFAULT_REQUESTS_PER_MINUTE),
+        "--tpm": ("tpm", DEFAULT_TOKENS_PER_MINUTE),
+    }
+    given = [
+        flag for flag, (dest, _) in concurrent_options.items() if getattr(args, dest) is not None
+    ]
+    if given and (args.jobs is None or args.batch):
+        parser.error(f"{', '.join(given)} can only be used with --jobs and without --batch.")
+    for flag, (dest, default) in concurrent_options.items():
+        value = getattr(args, dest)
+        if value is None:
+            setattr(args, dest, default)
+        elif value < 1:
+            parser.error(f"{flag} must be positive.")
+    return args
+
+
+@functools.lru_cache(maxsize=8)
 def load_template(path: Path, label: str) -> str:
     try:
         content = path.read_text(encoding="utf-8").strip()
@@ -63,11 +217,12 @@ def load_template(path: Path, label: str) -> str:
     return content
 
 
-def build_prompt(job_description: str, summary: str, sample_letter: str) -> str:
+@functools.lru_cache(maxsize=8)
+def build_system_prompt(summary: str, sample_letter: str) -> str:
     template = load_template(PROMPT_PATH, "prompt")
     try:
         return template.format(
-            job_description=job_description,
+            job_description=JOB_DESCRIPTION_REFERENCE,
             summary=summary,
             sample_letter=sample_letter,
         ).strip()
@@ -75,119 +230,677 @@ def build_prompt(job_description: str, summary: str, sample_letter: str) -> str:
         raise RuntimeError(f"Prompt template missing placeholder: {exc}") from exc
 
 
+def build_user_prompt(job_description: str) -> str:
+    return job_description.strip()
+
+
+def build_batch_user_prompt(job_descriptions: list[str]) -> str:
+    count = len(job_descriptions)
+    numbered = "\n\n".join(
+        f"Job {index}:\n{job_description}"
+        for index, job_description in enumerate(job_descriptions)
+    )
+    instructions = (
+        f"There are {count} job descriptions below, indexed 0..{count - 1}. "
+        "Write a separate cover letter for each job and return one JSON object per job "
+        "in `items`, in index order."
+    )
+    return f"{instructions}\n\n{numbered}"
+
+
+def build_messages(system_prompt: str, user_prompt: str) -> list[dict[str, str]]:
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
 def load_job_description(value: str) -> str:
-    candidate_path = Path(value)
-    try:
-        if candidate_path.exists():
-            return candidate_path.read_text(encoding="utf-8").strip()
-    except OSError:
-        pass
+    if (
+        len(value) < MAX_JOB_DESCRIPTION_PATH_LENGTH
+        and "\n" not in value
+        and value.endswith(".txt")
+    ):
+        candidate_path = Path(value)
+        try:
+            if candidate_path.exists():
+                return candidate_path.read_text(encoding="utf-8").strip()
+        except OSError:
+            pass
     return value.strip()
 
 
-class LetterPayload(BaseModel):
+def load_job_descriptions(path: Path) -> list[str]:
+    # Empty entries come back as "" so main can skip them along with other
+    # too-short descriptions instead of aborting the whole run.
+    if path.is_dir():
+        descriptions = []
+        for item in sorted(path.glob("*.txt")):
+            try:
+                descriptions.append(item.read_text(encoding="utf-8").strip())
+            except OSError as exc:
+                raise RuntimeError(f"Unable to read job description from {item}.") from exc
+    elif path.suffix == ".jsonl":
+        descriptions = []
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            raise RuntimeError(f"Unable to read job descriptions from {path}.") from exc
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json_loads(line)
+            except ValueError as exc:
+                raise RuntimeError(f"Invalid JSON on line {line_number} of {path}.") from exc
+            # Accept either a bare string or {"job_description": "..."}.
+            if isinstance(record, dict):
+                record = record.get("job_description") or ""
+            if not isinstance(record, str):
+                raise RuntimeError(
+                    f"Line {line_number} of {path} is not a job description string."
+                )
+            descriptions.append(record.strip())
+    else:
+        raise RuntimeError(f"Expected a directory or .jsonl file of job descriptions: {path}.")
+
+    if not descriptions:
+        raise RuntimeError(f"No job descriptions found in {path}.")
+    return descriptions
+
+
+class LetterPayload(TypedDict):
     filename: str
     letter: str
 
-    @field_validator("filename")
-    @classmethod
-    def validate_filename(cls, value: str) -> str:
-        filename = value.strip()
-        if not filename:
-            raise ValueError("LLM output missing filename.")
-        
-        # Remove path separators
-        if "/" in filename or "\\" in filename:
-            raise ValueError("LLM filename must not include path separators.")
-        
-        # Remove extension if present
-        if filename.lower().endswith((".pdf", ".txt")):
-            filename = filename[:-4].strip()
-        
-        if not filename:
-            raise ValueError("LLM filename is empty after cleanup.")
-        
-        # Validate character constraints
-        if not filename.isascii():
-            raise ValueError("LLM filename must use ASCII characters only.")
-        if " " in filename:
-            raise ValueError("LLM filename must use underscores instead of spaces.")
-        if not all(ch.isalnum() or ch == "_" for ch in filename):
-            raise ValueError(
-                "LLM filename must contain only letters, numbers, and underscores."
-            )
-        
-        return filename
 
-    @field_validator("letter")
-    @classmethod
-    def validate_letter(cls, value: str) -> str:
-        letter = value.strip()
-        if not letter:
-            raise ValueError("LLM output missing letter text.")
-        return letter
+class LetterBatch(TypedDict):
+    items: list[LetterPayload]
+
+
+LETTER_PAYLOAD_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "filename": {"type": "string"},
+        "letter": {"type": "string"},
+    },
+    "required": ["filename", "letter"],
+    "additionalProperties": False,
+}
+LETTER_BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {"items": {"type": "array", "items": LETTER_PAYLOAD_SCHEMA}},
+    "required": ["items"],
+    "additionalProperties": False,
+}
+
+
+def json_schema_format(name: str, schema: dict) -> dict:
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "strict": True, "schema": schema},
+    }
+
+
+LETTER_PAYLOAD_FORMAT = json_schema_format("LetterPayload", LETTER_PAYLOAD_SCHEMA)
+LETTER_BATCH_FORMAT = json_schema_format("LetterBatch", LETTER_BATCH_SCHEMA)
+
+
+def validate_filename(value: str) -> str:
+    filename = value.strip()
+    if not filename:
+        raise ValueError("LLM output missing filename.")
+    
+    # Remove path separators
+    if "/" in filename or "\\" in filename:
+        raise ValueError("LLM filename must not include path separators.")
+    
+    # Remove extension if present
+    if filename.lower().endswith((".pdf", ".txt")):
+        filename = filename[:-4].strip()
+    
+    if not filename:
+        raise ValueError("LLM filename is empty after cleanup.")
+    
+    # Validate character constraints
+    if " " in filename:
+        raise ValueError("LLM filename must use underscores instead of spaces.")
+    if not FILENAME_PATTERN.fullmatch(filename):
+        raise ValueError(
+            "LLM filename must contain only ASCII letters, numbers, and underscores."
+        )
+    
+    return filename
+
+
+def validate_letter(value: str) -> str:
+    letter = value.strip()
+    if not letter:
+        raise ValueError("LLM output missing letter text.")
+    return letter
+
+
+def validate_payload(data: Any) -> LetterPayload:
+    if not isinstance(data, dict):
+        raise ValueError("LLM output must be a JSON object.")
+    filename = data.get("filename")
+    letter = data.get("letter")
+    if not isinstance(filename, str) or not isinstance(letter, str):
+        raise ValueError("LLM output must include string filename and letter fields.")
+    return {"filename": validate_filename(filename), "letter": validate_letter(letter)}
+
+
+def validate_batch(data: Any) -> LetterBatch:
+    items = data.get("items") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        raise ValueError("LLM output missing items list.")
+    return {"items": [validate_payload(item) for item in items]}
+
+
+def cache_path(model: str, system_prompt: str, user_prompt: str) -> Path:
+    key = hashlib.sha256(
+        "\0".join((model, system_prompt, user_prompt)).encode("utf-8")
+    ).hexdigest()
+    return CACHE_DIR / f"{key}.json"
 
 
-def generate_letter_payload(client: OpenAI, prompt: str, model: str) -> tuple[str, str]:
+def read_cache[T](path: Path, validate: Callable[[Any], T]) -> T | None:
+    try:
+        return validate(json_loads(path.read_bytes()))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning(f"Ignoring unreadable cache entry {path}: {exc}")
+        return None
+
+
+def write_cache(path: Path, payload: Mapping[str, Any]) -> None:
+    # The response is already paid for, so a cache failure must not lose it.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json_dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.warning(f"Unable to write cache entry {path}: {exc}")
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+
+
+@functools.cache
+def get_client() -> OpenAI:
+    return OpenAI(http_client=DefaultHttpxClient(http2=HTTP2_ENABLED, limits=HTTP_LIMITS))
+
+
+def create_async_client() -> AsyncOpenAI:
+    # Retries are handled by the caller so they respect the shared rate budget.
+    return AsyncOpenAI(
+        max_retries=0,
+        http_client=DefaultAsyncHttpxClient(http2=HTTP2_ENABLED, limits=HTTP_LIMITS),
+    )
+
+
+def generate_letter_payload(
+    client: OpenAI,
+    system_prompt: str,
+    user_prompt: str,
+    model: str,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    echo: TextIO | None = None,
+) -> tuple[str, str]:
+    # When echo is given, the letter text (followed by a newline) is written to it
+    # as it streams in, so callers see output before the full response arrives.
+    path = cache_path(model, system_prompt, user_prompt)
+    if use_cache and not refresh_cache:
+        cached = read_cache(path, validate_payload)
+        if cached is not None:
+            logger.info("[green]✓ Using cached response[/green]")
+            if echo is not None:
+                echo.write(f"{cached['letter']}\n")
+                echo.flush()
+            return cached["filename"], cached["letter"]
+
     logger.info("Calling OpenAI API...")
+    content = ""
+    refusal = ""
+    finish_reason = None
+    echoed = ""
     try:
-        response = client.beta.chat.completions.parse(
+        with client.chat.completions.create(
             model=model,
-            messages=[{"role": "user", "content": prompt}],
-            response_format=LetterPayload,
-        )
+            messages=build_messages(system_prompt, user_prompt),
+            response_format=LETTER_PAYLOAD_FORMAT,
+            max_completion_tokens=LLM_MAX_COMPLETION_TOKENS,
+            temperature=LLM_TEMPERATURE,
+            stream=True,
+        ) as stream:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                finish_reason = chunk.choices[0].finish_reason or finish_reason
+                delta = chunk.choices[0].delta
+                refusal += delta.refusal or ""
+                if not delta.content:
+                    continue
+                content += delta.content
+                if echo is None:
+                    continue
+                letter = partial_letter(content)
+                if len(letter) > len(echoed) and letter.startswith(echoed):
+                    echo.write(letter[len(echoed) :])
+                    echo.flush()
+                    echoed = letter
     except (OSError, ValueError) as exc:
         logger.error(f"[red]API call failed: {exc}[/red]")
         raise
     
+    if finish_reason == "length" and echo is not None and echoed:
+        # End the partial letter's line before the error is reported.
+        echo.write("\n")
+        echo.flush()
+    check_finish_reason(finish_reason)
+    payload = validate_payload(parse_message_content(content, refusal))
+    if echo is not None:
+        if not payload["letter"].startswith(echoed):
+            echoed = ""
+        echo.write(f"{payload['letter'][len(echoed) :]}\n")
+        echo.flush()
     logger.info("[green]✓ API response received[/green]")
-    message = response.choices[0].message
-    
-    if message.refusal:
-        raise ValueError(f"LLM refused the request: {message.refusal}")
-    
-    payload = message.parsed
-    if payload is None:
+    if use_cache:
+        write_cache(path, payload)
+    return payload["filename"], payload["letter"]
+
+
+def partial_letter(snapshot: str) -> str:
+    # Trailing whitespace is held back until more text follows it, so what has
+    # been echoed is always a prefix of the final (stripped) letter.
+    try:
+        partial = from_json(snapshot.encode("utf-8"), partial_mode="trailing-strings")
+    except ValueError:
+        return ""
+    letter = partial.get("letter") if isinstance(partial, dict) else None
+    return letter.strip() if isinstance(letter, str) else ""
+
+
+def check_finish_reason(finish_reason: str | None) -> None:
+    if finish_reason == "length":
+        raise ValueError(
+            "Letter exceeded LLM_MAX_COMPLETION_TOKENS; the response was cut off."
+        )
+
+
+def parse_message_content(content: str | None, refusal: str | None = None) -> Any:
+    if refusal:
+        raise ValueError(f"LLM refused the request: {refusal}")
+    if not content:
         raise ValueError("LLM output missing structured payload.")
-    
-    return payload.filename, payload.letter
+    return json_loads(content)
+
+
+class CapacityLimiter:
+    """Leaky-bucket request and token budget shared by concurrent API calls."""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int) -> None:
+        self.max_requests = float(requests_per_minute)
+        self.max_tokens = float(tokens_per_minute)
+        self.available_request_capacity = self.max_requests
+        self.available_token_capacity = self.max_tokens
+        self.last_update = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed_minutes = (now - self.last_update) / 60
+        self.available_request_capacity = min(
+            self.max_requests,
+            self.available_request_capacity + elapsed_minutes * self.max_requests,
+        )
+        self.available_token_capacity = min(
+            self.max_tokens,
+            self.available_token_capacity + elapsed_minutes * self.max_tokens,
+        )
+        self.last_update = now
+
+    async def acquire(self, tokens: int) -> None:
+        # A single request larger than the whole budget would otherwise wait forever.
+        tokens = min(tokens, self.max_tokens)
+        async with self.lock:
+            while True:
+                self._refill()
+                if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                    self.available_request_capacity -= 1
+                    self.available_token_capacity -= tokens
+                    return
+                missing_requests = max(0.0, 1 - self.available_request_capacity)
+                missing_tokens = max(0.0, tokens - self.available_token_capacity)
+                await asyncio.sleep(
+                    60 * max(missing_requests / self.max_requests, missing_tokens / self.max_tokens)
+                )
+
+
+def estimate_tokens(system_prompt: str, user_prompt: str, letters: int = 1) -> int:
+    prompt_chars = len(system_prompt) + len(user_prompt)
+    return prompt_chars // CHARS_PER_TOKEN_ESTIMATE + letters * LLM_MAX_COMPLETION_TOKENS
+
+
+async def generate_letter_batch_async(
+    client: AsyncOpenAI,
+    system_prompt: str,
+    user_prompt: str,
+    letters: int,
+    model: str,
+    semaphore: asyncio.Semaphore,
+    limiter: CapacityLimiter,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+) -> list[LetterPayload]:
+    path = cache_path(model, system_prompt, user_prompt)
+    if use_cache and not refresh_cache:
+        cached = read_cache(path, validate_batch)
+        if cached is not None:
+            return cached["items"]
+
+    attempt = 1
+    async with semaphore:
+        while True:
+            await limiter.acquire(estimate_tokens(system_prompt, user_prompt, letters))
+            try:
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=build_messages(system_prompt, user_prompt),
+                    response_format=LETTER_BATCH_FORMAT,
+                    max_completion_tokens=letters * LLM_MAX_COMPLETION_TOKENS,
+                    temperature=LLM_TEMPERATURE,
+                )
+            except (RateLimitError, APIConnectionError, InternalServerError) as exc:
+                if attempt >= RETRY_MAX_ATTEMPTS:
+                    raise
+                delay = min(RETRY_BASE_DELAY * 2 ** (attempt - 1), RETRY_MAX_DELAY)
+                logger.warning(f"API call failed ({exc}); retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            check_finish_reason(response.choices[0].finish_reason)
+            message = response.choices[0].message
+            batch = validate_batch(parse_message_content(message.content, message.refusal))
+            if len(batch["items"]) != letters:
+                # Not cached, so the next run retries this request.
+                logger.warning(f"Expected {letters} letters in one response, got {len(batch['items'])}")
+            elif use_cache:
+                write_cache(path, batch)
+            return batch["items"]
+
+
+async def generate_many(
+    job_batches: list[list[str]],
+    system_prompt: str,
+    model: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+    tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+) -> tuple[list[LetterPayload], int]:
+    # Returns the letters received and how many requested letters are missing.
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = CapacityLimiter(requests_per_minute, tokens_per_minute)
+    async with create_async_client() as client:
+        results = await asyncio.gather(
+            *(
+                generate_letter_batch_async(
+                    client,
+                    system_prompt,
+                    build_batch_user_prompt(job_batch),
+                    len(job_batch),
+                    model,
+                    semaphore,
+                    limiter,
+                    use_cache,
+                    refresh_cache,
+                )
+                for job_batch in job_batches
+            ),
+            return_exceptions=True,
+        )
+
+    payloads: list[LetterPayload] = []
+    missing = 0
+    for index, result in enumerate(results):
+        letters = len(job_batches[index])
+        if isinstance(result, BaseException):
+            logger.error(f"[red]Request {index} ({letters} letters) failed: {result}[/red]")
+            missing += letters
+            continue
+        payloads.extend(result)
+        missing += max(0, letters - len(result))
+    total = sum(len(job_batch) for job_batch in job_batches)
+    logger.info(f"[green]✓ {total - missing}/{total} cover letters received[/green]")
+    return payloads, missing
+
+
+def submit_batch(
+    client: OpenAI, system_prompt: str, user_prompts: Mapping[int, str], model: str
+) -> str:
+    # custom_id carries the job's index in the --jobs input, so a resumed run
+    # can match results back to jobs without resubmitting.
+    lines = [
+        json_dumps(
+            {
+                "custom_id": f"job-{index}",
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": {
+                    "model": model,
+                    "messages": build_messages(system_prompt, user_prompt),
+                    "response_format": LETTER_PAYLOAD_FORMAT,
+                    "max_completion_tokens": LLM_MAX_COMPLETION_TOKENS,
+                    "temperature": LLM_TEMPERATURE,
+                },
+            }
+        )
+        for index, user_prompt in user_prompts.items()
+    ]
+
+    logger.info(f"Uploading batch of {len(user_prompts)} requests...")
+    batch_file = client.files.create(
+        file=("cover_letters_batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=BATCH_COMPLETION_WINDOW,
+    )
+    logger.info(f"[green]✓ Batch submitted: {batch.id}[/green]")
+    logger.info(
+        f"If this run is interrupted, rerun the same command with --resume-batch {batch.id} "
+        "to collect the results without resubmitting."
+    )
+    return batch.id
+
+
+def parse_batch_output(content: str) -> dict[int, LetterPayload]:
+    results: dict[int, LetterPayload] = {}
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        record = json_loads(line)
+        custom_id = record.get("custom_id", "")
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            logger.error(f"[red]Batch request {custom_id} failed: {record.get('error') or response}[/red]")
+            continue
+
+        choice = response["body"]["choices"][0]
+        message = choice["message"]
+        try:
+            check_finish_reason(choice.get("finish_reason"))
+            payload = validate_payload(
+                parse_message_content(message.get("content"), message.get("refusal"))
+            )
+        except ValueError as exc:
+            logger.error(f"[red]Batch request {custom_id} returned no letter: {exc}[/red]")
+            continue
+        results[int(custom_id.removeprefix("job-"))] = payload
+
+    return results
+
+
+def wait_for_batch(client: OpenAI, batch_id: str) -> dict[int, LetterPayload]:
+    delay = BATCH_POLL_INITIAL_DELAY
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in BATCH_TERMINAL_STATUSES:
+            break
+        logger.info(f"Batch {batch_id} is {batch.status}; checking again in {delay:.0f}s")
+        time.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX_DELAY)
+
+    # A failed batch never ran. Expired and cancelled batches still publish (and
+    # bill) the requests that finished, so collect those like a completed batch.
+    if batch.status == "failed":
+        raise RuntimeError(f"Batch {batch_id} failed.")
+    if batch.status == "completed":
+        logger.info(f"[green]✓ Batch {batch_id} completed[/green]")
+    else:
+        logger.warning(f"Batch {batch_id} {batch.status}; collecting the requests that finished")
+    if batch.request_counts and batch.request_counts.failed:
+        logger.error(f"[red]{batch.request_counts.failed} batch requests failed.[/red]")
+    if not batch.output_file_id:
+        logger.error(f"[red]Batch {batch_id} has no output file.[/red]")
+        return {}
+
+    return parse_batch_output(client.files.content(batch.output_file_id).text)
+
+
+def run_batch(
+    client: OpenAI,
+    system_prompt: str,
+    user_prompts: list[str],
+    model: str,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    resume_batch_id: str | None = None,
+) -> tuple[list[LetterPayload], int]:
+    # Returns the letters received and how many requested letters are missing.
+    paths = [cache_path(model, system_prompt, user_prompt) for user_prompt in user_prompts]
+    results: dict[int, LetterPayload] = {}
+    if use_cache and not refresh_cache:
+        for index, path in enumerate(paths):
+            cached = read_cache(path, validate_payload)
+            if cached is not None:
+                results[index] = cached
+
+    pending = [index for index in range(len(user_prompts)) if index not in results]
+    if results:
+        logger.info(f"[green]✓ Using {len(results)} cached responses[/green]")
+    if pending:
+        batch_id = resume_batch_id or submit_batch(
+            client=client,
+            system_prompt=system_prompt,
+            user_prompts={index: user_prompts[index] for index in pending},
+            model=model,
+        )
+        for index, payload in wait_for_batch(client=client, batch_id=batch_id).items():
+            if index not in pending:
+                continue
+            results[index] = payload
+            if use_cache:
+                write_cache(paths[index], payload)
+
+    missing = len(user_prompts) - len(results)
+    return [results[index] for index in sorted(results)], missing
 
 
 def default_pdf_path(filename: str) -> Path:
     return BASE_OUTPUT_DIR / f"{filename}.pdf"
 
 
+def unique_pdf_path(filename: str, used_paths: set[Path]) -> Path:
+    # The model picks filenames, so bulk runs can repeat one; suffix repeats
+    # instead of overwriting a letter written earlier in the same run.
+    path = default_pdf_path(filename)
+    suffix = 2
+    while path in used_paths:
+        path = default_pdf_path(f"{filename}_{suffix}")
+        suffix += 1
+    used_paths.add(path)
+    return path
+
+
+def wrap_to_width(line: str, max_width: float, measure: Callable[[str], float]) -> list[str]:
+    # Greedy word fill against the measured text width; standard PDF fonts have
+    # no kerning, so a line's width is the sum of its words and spaces.
+    space_width = measure(" ")
+    lines: list[str] = []
+    current = ""
+    current_width = 0.0
+    for word in line.split():
+        word_width = measure(word)
+        if current and current_width + space_width + word_width <= max_width:
+            current = f"{current} {word}"
+            current_width += space_width + word_width
+            continue
+        if current:
+            lines.append(current)
+        # Split words wider than the whole column (e.g. long URLs) across lines.
+        while word_width > max_width and len(word) > 1:
+            cut = len(word) - 1
+            while cut > 1 and measure(word[:cut]) > max_width:
+                cut -= 1
+            lines.append(word[:cut])
+            word = word[cut:]
+            word_width = measure(word)
+        current = word
+        current_width = word_width
+    if current:
+        lines.append(current)
+    return lines
+
+
 def write_pdf(letter_text: str, output_path: Path) -> None:
+    # reportlab is only needed once a letter exists, so keep it off the startup path.
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.pdfgen import canvas
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
     logger.info(f"Generating PDF: [yellow]{output_path}[/yellow]")
 
-    doc = SimpleDocTemplate(
-        str(output_path),
-        pagesize=PDF_PAGE_SIZE,
-        leftMargin=PDF_MARGIN,
-        rightMargin=PDF_MARGIN,
-        topMargin=PDF_MARGIN,
-        bottomMargin=PDF_MARGIN,
-    )
+    page_width, page_height = PDF_PAGE_SIZE
+    text_width = page_width - 2 * PDF_MARGIN
 
-    styles = getSampleStyleSheet()
-    body = ParagraphStyle(
-        "Body",
-        parent=styles["Normal"],
-        fontName=PDF_FONT_NAME,
-        fontSize=PDF_FONT_SIZE,
-        leading=PDF_LINE_HEIGHT,
-        spaceAfter=PDF_PARAGRAPH_SPACING,
-    )
+    def measure(text: str) -> float:
+        return stringWidth(text, PDF_FONT_NAME, PDF_FONT_SIZE)
 
-    story: list[Paragraph | Spacer] = []
+    lines: list[str] = []
     for paragraph in letter_text.split("\n\n"):
         if not paragraph.strip():
             continue
-        story.append(Paragraph(paragraph.replace("\n", "<br/>"), body))
-        story.append(Spacer(1, PDF_PARAGRAPH_SPACER))
-
-    doc.build(story)
+        for line in paragraph.splitlines():
+            lines.extend(wrap_to_width(line, text_width, measure) or [""])
+        lines.append("")
+
+    lines_per_page = int((page_height - 2 * PDF_MARGIN) // PDF_LINE_HEIGHT)
+
+    with open(output_path, "wb", buffering=PDF_WRITE_BUFFER_SIZE) as output_file:
+        # Resolve the font once on the canvas; every page's text object inherits it
+        # instead of looking it up again through setFont.
+        pdf = canvas.Canvas(
+            output_file,
+            pagesize=PDF_PAGE_SIZE,
+            initialFontName=PDF_FONT_NAME,
+            initialFontSize=PDF_FONT_SIZE,
+            initialLeading=PDF_LINE_HEIGHT,
+        )
+        for start in range(0, len(lines), lines_per_page):
+            # One text object per page keeps all lines in a single BT/ET block.
+            text = pdf.beginText(PDF_MARGIN, page_height - PDF_MARGIN - PDF_FONT_SIZE)
+            for line in lines[start : start + lines_per_page]:
+                text.textLine(line)
+            pdf.drawText(text)
+            pdf.showPage()
+        pdf.save()
     logger.info(f"[green bold]✓ Saved {output_path}[/green bold]")
 
 
@@ -199,25 +912,85 @@ def write_text_file(letter_text: str, output_path: Path) -> None:
 
 def main() -> None:
     args = parse_args()
+    configure_logging()
+    load_environment()
 
-    job_description = load_job_description(args.job_description)
     summary = load_template(SUMMARY_PATH, "summary")
     sample_letter = load_template(SAMPLE_LETTER_PATH, "sample letter")
-    prompt = build_prompt(
-        job_description=job_description,
-        summary=summary,
-        sample_letter=sample_letter,
-    )
+    system_prompt = build_system_prompt(summary=summary, sample_letter=sample_letter)
+    use_cache = not args.no_cache
+
+    if args.jobs is not None:
+        job_descriptions = load_job_descriptions(args.jobs)
+        too_short = sum(
+            len(description) < MIN_JOB_DESCRIPTION_LENGTH for description in job_descriptions
+        )
+        if too_short:
+            logger.warning(f"Skipping {too_short} job descriptions that are empty or too short")
+            job_descriptions = [
+                description
+                for description in job_descriptions
+                if len(description) >= MIN_JOB_DESCRIPTION_LENGTH
+            ]
+        if not job_descriptions:
+            raise SystemExit("No job descriptions long enough to generate a letter.")
+        if args.batch:
+            logger.info(f"Generating {len(job_descriptions)} cover letters via the Batch API")
+            payloads, missing = run_batch(
+                client=get_client(),
+                system_prompt=system_prompt,
+                user_prompts=[build_user_prompt(description) for description in job_descriptions],
+                model=DEFAULT_LLM_MODEL,
+                use_cache=use_cache,
+                refresh_cache=args.refresh_cache,
+                resume_batch_id=args.resume_batch,
+            )
+        else:
+            logger.info(f"Generating {len(job_descriptions)} cover letters")
+            job_batches = [
+                job_descriptions[start : start + args.batch_size]
+                for start in range(0, len(job_descriptions), args.batch_size)
+            ]
+            payloads, missing = asyncio.run(
+                generate_many(
+                    job_batches=job_batches,
+                    system_prompt=system_prompt,
+                    model=DEFAULT_LLM_MODEL,
+                    concurrency=args.concurrency,
+                    requests_per_minute=args.rpm,
+                    tokens_per_minute=args.tpm,
+                    use_cache=use_cache,
+                    refresh_cache=args.refresh_cache,
+                )
+            )
+
+        used_paths: set[Path] = set()
+        for payload in payloads:
+            print(payload["letter"])
+            write_pdf(payload["letter"], unique_pdf_path(payload["filename"], used_paths))
+        if missing:
+            # Exit non-zero so Automator and shell callers notice lost letters.
+            logger.error(f"[red]{missing} cover letters were not generated.[/red]")
+            raise SystemExit(1)
+        return
+
+    job_description = load_job_description(args.job_description)
+    if len(job_description) < MIN_JOB_DESCRIPTION_LENGTH:
+        raise SystemExit("Job description too short.")
 
     logger.info("Generating cover letter from job description")
-    client = OpenAI()
+    client = get_client()
     filename, letter_text = generate_letter_payload(
-        client=client, prompt=prompt, model=DEFAULT_LLM_MODEL 
+        client=client,
+        system_prompt=system_prompt,
+        user_prompt=build_user_prompt(job_description),
+        model=DEFAULT_LLM_MODEL,
+        use_cache=use_cache,
+        refresh_cache=args.refresh_cache,
+        # Always print the letter text so Automator or shell callers can capture it.
+        echo=sys.stdout,
     )
 
-    # Always print the letter text so Automator or shell callers can capture it.
-    print(letter_text)
-
     pdf_path = default_pdf_path(filename)
     write_pdf(letter_text, pdf_path)
 